@@ -9,13 +9,114 @@ import io
 import hashlib
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
-import httpx
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
 
 from llm_client import llm
 from browser_handler import get_browser
-from data_processor import processor
+from data_processor import processor, get_http_client
+
+# Faster JSON codec when available (C implementation, ~5-10x stdlib)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when installed, stdlib otherwise"""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps_indented(value: Any) -> str:
+    """Pretty-print JSON for LLM context with the fastest codec available"""
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(value, indent=2)
+
+
+# Precompiled patterns for quiz page parsing (avoids re-compiling per quiz).
+# The submit-URL alternatives are fused into one alternation so each string is
+# scanned once instead of once per pattern.
+_SUBMIT_RE = re.compile(
+    '|'.join(f'(?:{p})' for p in (
+        r'(?:post|submit|send)\s+(?:your\s+)?(?:answer\s+)?to\s+[`"\']?(https?://[^\s<>"`\']+)[`"\']?',
+        r'POST\s+to\s+[`"\']?(https?://[^\s<>"`\']+)[`"\']?',
+        r'(https?://[^\s<>"`\']+/submit[^\s<>"`\']*)',
+        r'(https?://[^\s<>"`\']+/answer[^\s<>"`\']*)',
+        r'endpoint[:\s]+[`"\']?(https?://[^\s<>"`\']+)[`"\']?',
+    )),
+    re.IGNORECASE,
+)
+_FILE_HREF_RE = re.compile(r'<a[^>]+href=["\']?([^"\'>\s]+)["\']?[^>]*>', re.IGNORECASE)
+# File URLs and API endpoints fused so text+html is scanned once, not three times
+_RESOURCE_RE = re.compile(
+    r'(?P<file>https?://[^\s<>"`\']+\.(?:pdf|csv|xlsx?|json|txt|png|jpe?g|gif))'
+    r'|(?P<api>https?://[^\s<>"`\']+/api/[^\s<>"`\']*)',
+    re.IGNORECASE,
+)
+
+# Question-type keywords fused into a single alternation; the matched group
+# name is the question type. One scan replaces ~15 substring passes.
+# Alternative order here is the dispatch priority: a question matching
+# several categories gets the earliest one, regardless of where in the
+# text each keyword appears.
+_QTYPE_RE = re.compile(
+    r'(?P<sum>sum of|total|add up|combined)'
+    r'|(?P<average>average|mean|avg)'
+    r'|(?P<count>count|how many|number of)'
+    r'|(?P<max>maximum|max|highest|largest)'
+    r'|(?P<min>minimum|min|lowest|smallest)'
+    r'|(?P<median>median)'
+    r'|(?P<std>standard deviation|std)'
+    r'|(?P<filter>where|which|filter|find)'
+    r'|(?P<sort>sort|order|rank)'
+    r'|(?P<group>group by|grouped|per)'
+    r'|(?P<visualization>chart|plot|graph|visualiz|draw)'
+    r'|(?P<image>image|picture|photo|screenshot)'
+    r'|(?P<hash>hash|md5|sha)'
+    r'|(?P<encode>encode|base64)',
+    re.IGNORECASE,
+)
+# Group names in declaration order - the dispatch priority
+_QTYPE_PRIORITY = tuple(sorted(_QTYPE_RE.groupindex, key=_QTYPE_RE.groupindex.get))
+
+
+_NON_NUMERIC_RE = re.compile(r'[^\d.\-e]')
+# Hash/encode operands anchored to the instruction ("md5 of 'X'",
+# "base64 encoding of 'X'") - a quoted string elsewhere in the question,
+# like a filename, is not the thing to hash
+_HASH_OPERAND_RE = re.compile(
+    r'(?:md5|sha\d*)\s+(?:hash\s+)?(?:of|for)\s+(?:the\s+)?(?:string\s+|text\s+)?'
+    r'["\'`]([^"\'`]+)["\'`]',
+    re.IGNORECASE,
+)
+_B64_OPERAND_RE = re.compile(
+    r'base64[\s-]*(?:encod\w+\s+|decod\w+\s+)?(?:of|for)\s+(?:the\s+)?(?:string\s+|text\s+)?'
+    r'["\'`]([^"\'`]+)["\'`]',
+    re.IGNORECASE,
+)
+_FILE_EXTS = frozenset(('pdf', 'csv', 'xlsx', 'xls', 'json', 'txt', 'png', 'jpg', 'jpeg', 'gif'))
+
+# The LLM prompt truncates context to this many chars; no point materializing more
+_MAX_CONTEXT_CHARS = 50000
+
+# Aggregations that can be answered straight from a numeric Series
+_DF_AGGS = {
+    'sum': lambda s: float(s.sum()),
+    'average': lambda s: round(float(s.mean()), 2),
+    'count': lambda s: int(s.count()),
+    'max': lambda s: float(s.max()),
+    'min': lambda s: float(s.min()),
+    'median': lambda s: float(s.median()),
+    'std': lambda s: round(float(s.std()), 2),
+}
 
 
 class AdvancedQuizSolver:
@@ -27,6 +128,7 @@ class AdvancedQuizSolver:
         self.llm = llm
         self.processor = processor
         self.data_cache = {}  # Cache for downloaded data
+        self.answer_cache = {}  # (question_hash, context_hash) -> parsed answer
     
     async def solve_quiz(self, quiz_url: str) -> Dict[str, Any]:
         """Main entry point"""
@@ -71,161 +173,133 @@ class AdvancedQuizSolver:
             'resources': []
         }
         
-        # Find submit URL
-        submit_patterns = [
-            r'(?:post|submit|send)\s+(?:your\s+)?(?:answer\s+)?to\s+[`"\']?(https?://[^\s<>"`\']+)[`"\']?',
-            r'POST\s+to\s+[`"\']?(https?://[^\s<>"`\']+)[`"\']?',
-            r'(https?://[^\s<>"`\']+/submit[^\s<>"`\']*)',
-            r'(https?://[^\s<>"`\']+/answer[^\s<>"`\']*)',
-            r'endpoint[:\s]+[`"\']?(https?://[^\s<>"`\']+)[`"\']?',
-        ]
-        
-        for pattern in submit_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                result['submit_url'] = match.group(1).rstrip('.,;:')
-                break
-        
-        if not result['submit_url']:
-            for pattern in submit_patterns:
-                match = re.search(pattern, html, re.IGNORECASE)
-                if match:
-                    result['submit_url'] = match.group(1).rstrip('.,;:')
-                    break
-        
+        # Find submit URL - single pass over text, falling back to html
+        match = _SUBMIT_RE.search(text) or _SUBMIT_RE.search(html)
+        if match:
+            url = next(g for g in match.groups() if g)
+            result['submit_url'] = url.rstrip('.,;:')
+
         # Find resources (files, APIs, etc.)
         found_urls = set()
-        
+
         # File links
-        file_pattern = r'<a[^>]+href=["\']?([^"\'>\s]+)["\']?[^>]*>'
-        for match in re.finditer(file_pattern, html, re.IGNORECASE):
+        for match in _FILE_HREF_RE.finditer(html):
             href = match.group(1)
-            if any(ext in href.lower() for ext in ['.pdf', '.csv', '.xlsx', '.xls', '.json', '.txt', '.png', '.jpg', '.jpeg', '.gif']):
+            # One rpartition + set lookup instead of ten substring scans
+            path = href.split('?', 1)[0].split('#', 1)[0]
+            if path.rpartition('.')[2].lower() in _FILE_EXTS:
                 full_url = urljoin(base_url, href)
                 if full_url not in found_urls:
                     found_urls.add(full_url)
                     result['resources'].append({'url': full_url, 'type': 'file'})
         
-        # Direct URLs in text
-        url_pattern = r'(https?://[^\s<>"`\']+\.(?:pdf|csv|xlsx?|json|txt|png|jpe?g|gif))'
-        for match in re.finditer(url_pattern, text, re.IGNORECASE):
-            url = match.group(1).rstrip('.,;:')
-            if url not in found_urls and result['submit_url'] not in url:
-                found_urls.add(url)
-                result['resources'].append({'url': url, 'type': 'file'})
-        
-        # API endpoints
-        api_pattern = r'(https?://[^\s<>"`\']+/api/[^\s<>"`\']*)'
-        for match in re.finditer(api_pattern, text + html, re.IGNORECASE):
-            url = match.group(1).rstrip('.,;:')
-            if url not in found_urls:
-                found_urls.add(url)
-                result['resources'].append({'url': url, 'type': 'api'})
-        
+        # Direct file URLs and API endpoints - one combined pass
+        for match in _RESOURCE_RE.finditer(text + html):
+            url = match.group().rstrip('.,;:')
+            rtype = match.lastgroup
+            if url in found_urls:
+                continue
+            if rtype == 'file' and result['submit_url'] and result['submit_url'] in url:
+                continue
+            found_urls.add(url)
+            result['resources'].append({'url': url, 'type': rtype})
+
         return result
     
     async def _gather_resources(self, resources: List[Dict]) -> str:
-        """Download and process all resources"""
+        """Download and process all resources concurrently"""
+        if not resources:
+            return ''
+
+        # Fetch all resources in parallel; each returns its own context chunk
+        chunks = await asyncio.gather(
+            *(self._process_resource(resource) for resource in resources)
+        )
+
+        # Accumulate parts up to the LLM context budget instead of building
+        # an arbitrarily large string that gets truncated downstream anyway
+        parts = []
+        total = 0
+        for chunk in chunks:
+            for part in chunk:
+                parts.append(part)
+                total += len(part) + 1
+            if total >= _MAX_CONTEXT_CHARS:
+                break
+        return '\n'.join(parts)
+
+    async def _process_resource(self, resource: Dict) -> List[str]:
+        """Download and process a single resource into context lines"""
+        url = resource['url']
         context_parts = []
-        
-        for resource in resources:
-            url = resource['url']
-            rtype = resource.get('type', 'file')
-            
-            try:
-                print(f"[AdvancedSolver] Fetching: {url}")
-                content, content_type = await self.processor.fetch_url(url)
-                file_type = self.processor.detect_file_type(content, content_type, url)
-                
-                print(f"[AdvancedSolver] Type: {file_type}, Size: {len(content)} bytes")
-                
-                if file_type == 'pdf':
-                    pdf_data = self.processor.process_pdf(content)
-                    context_parts.append(f"\n=== PDF from {url} ===")
-                    context_parts.append(pdf_data['text'])
-                    
-                    # Also include tables in structured format
-                    for i, table in enumerate(pdf_data.get('tables', [])):
-                        context_parts.append(f"\n--- Table {i+1} on Page {table['page']} ---")
-                        for row in table['data']:
-                            context_parts.append(' | '.join(str(cell) for cell in row))
-                
-                elif file_type == 'csv':
-                    df = self.processor.process_csv(content)
-                    self.data_cache[url] = df
-                    context_parts.append(f"\n=== CSV from {url} ===")
-                    context_parts.append(self.processor.dataframe_to_context(df))
-                
-                elif file_type == 'excel':
-                    df = self.processor.process_excel(content)
-                    self.data_cache[url] = df
-                    context_parts.append(f"\n=== Excel from {url} ===")
-                    context_parts.append(self.processor.dataframe_to_context(df))
-                
-                elif file_type == 'json':
-                    json_data = self.processor.process_json(content)
-                    self.data_cache[url] = json_data
-                    context_parts.append(f"\n=== JSON from {url} ===")
-                    context_parts.append(json.dumps(json_data, indent=2))
-                
-                elif file_type == 'image':
-                    img_data = self.processor.process_image(content)
-                    self.data_cache[url] = img_data
-                    context_parts.append(f"\n=== Image from {url} ===")
-                    context_parts.append(f"[Image: {img_data['width']}x{img_data['height']} {img_data['format']}]")
-                
-                else:
-                    try:
-                        text = content.decode('utf-8')
-                    except:
-                        text = content.decode('latin-1', errors='ignore')
-                    context_parts.append(f"\n=== Text from {url} ===")
-                    context_parts.append(text[:10000])  # Limit text size
-                    
-            except Exception as e:
-                print(f"[AdvancedSolver] Error fetching {url}: {e}")
-                context_parts.append(f"\n=== Error fetching {url}: {e} ===")
-        
-        return '\n'.join(context_parts)
+
+        try:
+            print(f"[AdvancedSolver] Fetching: {url}")
+            content, content_type = await self.processor.fetch_url(url)
+            file_type = self.processor.detect_file_type(content, content_type, url)
+
+            print(f"[AdvancedSolver] Type: {file_type}, Size: {len(content)} bytes")
+
+            # PDF/CSV/Excel parsing is CPU-bound; run in worker threads so the
+            # event loop keeps serving the other concurrent fetches
+            if file_type == 'pdf':
+                pdf_data = await asyncio.to_thread(self.processor.process_pdf, content)
+                context_parts.append(f"\n=== PDF from {url} ===")
+                context_parts.append(pdf_data['text'])
+
+                # Also include tables in structured format - one DataFrame
+                # conversion per table instead of a Python loop per row
+                for i, table in enumerate(pdf_data.get('tables', [])):
+                    context_parts.append(f"\n--- Table {i+1} on Page {table['page']} ---")
+                    context_parts.append(
+                        pd.DataFrame(table['data']).to_string(header=False, index=False)
+                    )
+
+            elif file_type == 'csv':
+                df = await asyncio.to_thread(self.processor.process_csv, content)
+                self.data_cache[url] = df
+                context_parts.append(f"\n=== CSV from {url} ===")
+                context_parts.append(self.processor.dataframe_to_context(df))
+
+            elif file_type == 'excel':
+                df = await asyncio.to_thread(self.processor.process_excel, content)
+                self.data_cache[url] = df
+                context_parts.append(f"\n=== Excel from {url} ===")
+                context_parts.append(self.processor.dataframe_to_context(df))
+
+            elif file_type == 'json':
+                json_data = self.processor.process_json(content)
+                self.data_cache[url] = json_data
+                context_parts.append(f"\n=== JSON from {url} ===")
+                context_parts.append(_json_dumps_indented(json_data))
+
+            elif file_type == 'image':
+                img_data = self.processor.process_image(content)
+                self.data_cache[url] = img_data
+                context_parts.append(f"\n=== Image from {url} ===")
+                context_parts.append(f"[Image: {img_data['width']}x{img_data['height']} {img_data['format']}]")
+
+            else:
+                text = content.decode('utf-8', errors='replace')
+                context_parts.append(f"\n=== Text from {url} ===")
+                context_parts.append(text[:10000])  # Limit text size
+
+        except Exception as e:
+            print(f"[AdvancedSolver] Error fetching {url}: {e}")
+            context_parts.append(f"\n=== Error fetching {url}: {e} ===")
+
+        return context_parts
     
     def _detect_question_type(self, question: str) -> str:
         """Detect the type of question"""
-        q_lower = question.lower()
-        
-        # Calculation types
-        if any(word in q_lower for word in ['sum of', 'total', 'add up', 'combined']):
-            return 'sum'
-        if any(word in q_lower for word in ['average', 'mean', 'avg']):
-            return 'average'
-        if any(word in q_lower for word in ['count', 'how many', 'number of']):
-            return 'count'
-        if any(word in q_lower for word in ['maximum', 'max', 'highest', 'largest']):
-            return 'max'
-        if any(word in q_lower for word in ['minimum', 'min', 'lowest', 'smallest']):
-            return 'min'
-        if any(word in q_lower for word in ['median']):
-            return 'median'
-        if any(word in q_lower for word in ['standard deviation', 'std']):
-            return 'std'
-        
-        # Filter/lookup types
-        if any(word in q_lower for word in ['where', 'which', 'filter', 'find']):
-            return 'filter'
-        if any(word in q_lower for word in ['sort', 'order', 'rank']):
-            return 'sort'
-        if any(word in q_lower for word in ['group by', 'grouped', 'per']):
-            return 'group'
-        
-        # Special types
-        if any(word in q_lower for word in ['chart', 'plot', 'graph', 'visualiz', 'draw']):
-            return 'visualization'
-        if any(word in q_lower for word in ['image', 'picture', 'photo', 'screenshot']):
-            return 'image'
-        if any(word in q_lower for word in ['hash', 'md5', 'sha']):
-            return 'hash'
-        if any(word in q_lower for word in ['encode', 'base64']):
-            return 'encode'
-        
+        # Collect every category present, then pick by priority order -
+        # search() alone would return whichever keyword appears first in
+        # the text ('find the sum of ...' must be 'sum', not 'filter')
+        matched = {m.lastgroup for m in _QTYPE_RE.finditer(question)}
+        if matched:
+            for q_type in _QTYPE_PRIORITY:
+                if q_type in matched:
+                    return q_type
         return 'general'
     
     async def _solve_by_type(self, question: str, q_type: str, data_context: str, screenshot: bytes) -> Any:
@@ -247,8 +321,52 @@ class AdvancedQuizSolver:
                     if chart_base64:
                         return f"data:image/png;base64,{chart_base64}"
         
+        # Hash/encode questions are deterministic - answer locally, no LLM call
+        if q_type == 'hash':
+            result = self._compute_hash(question)
+            if result is not None:
+                return result
+
+        if q_type == 'encode':
+            result = self._compute_encoding(question)
+            if result is not None:
+                return result
+
         # Use LLM for general solving
         return self._llm_solve(question, data_context, screenshot)
+
+    def _compute_hash(self, question: str) -> Optional[str]:
+        """Hash the quoted operand of an explicit 'hash of/for X' question.
+        Returns None (deferring to the LLM) when the operand isn't anchored
+        to the instruction - a quoted filename elsewhere must not be hashed."""
+        q_lower = question.lower()
+        algo = next((name for name in ('sha512', 'sha256', 'sha1', 'md5') if name in q_lower), None)
+        if not algo:
+            return None
+
+        match = _HASH_OPERAND_RE.search(question)
+        if not match:
+            return None
+        return hashlib.new(algo, match.group(1).encode()).hexdigest()
+
+    def _compute_encoding(self, question: str) -> Optional[str]:
+        """Base64 encode/decode the quoted operand of an explicit
+        'base64 ... of/for X' question; otherwise defer to the LLM"""
+        q_lower = question.lower()
+        if 'base64' not in q_lower:
+            return None
+
+        match = _B64_OPERAND_RE.search(question)
+        if not match:
+            return None
+        payload = match.group(1)
+
+        if 'decode' in q_lower:
+            try:
+                return base64.b64decode(payload).decode()
+            except Exception:
+                return None
+        return base64.b64encode(payload.encode()).decode()
     
     async def _calculate_from_dataframe(self, question: str, q_type: str, df: pd.DataFrame) -> Optional[Any]:
         """Try to calculate answer from dataframe"""
@@ -272,36 +390,32 @@ class AdvancedQuizSolver:
         
         if not target_column:
             return None
-        
+
         try:
-            col_data = pd.to_numeric(df[target_column], errors='coerce')
-            
-            if q_type == 'sum':
-                return float(col_data.sum())
-            elif q_type == 'average':
-                return round(float(col_data.mean()), 2)
-            elif q_type == 'count':
-                return int(col_data.count())
-            elif q_type == 'max':
-                return float(col_data.max())
-            elif q_type == 'min':
-                return float(col_data.min())
-            elif q_type == 'median':
-                return float(col_data.median())
-            elif q_type == 'std':
-                return round(float(col_data.std()), 2)
+            col_data = df[target_column]
+            # Skip the to_numeric coercion pass when pandas already parsed
+            # the column as numeric (the common case for CSV/Excel data)
+            if not pd.api.types.is_numeric_dtype(col_data):
+                col_data = pd.to_numeric(col_data, errors='coerce')
+
+            agg = _DF_AGGS.get(q_type)
+            if agg:
+                return agg(col_data)
         except Exception as e:
             print(f"[AdvancedSolver] Calculation error: {e}")
-        
+
         return None
     
     async def _generate_chart(self, question: str, df: pd.DataFrame) -> Optional[str]:
         """Generate a chart based on the question"""
+        # Rendering + base64 encoding is CPU-bound; run it in a worker thread
+        # so the event loop stays free for concurrent fetches
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._render_chart, question, df)
+
+    def _render_chart(self, question: str, df: pd.DataFrame) -> Optional[str]:
+        """Render a chart synchronously and return it base64-encoded"""
         try:
-            import matplotlib
-            matplotlib.use('Agg')
-            import matplotlib.pyplot as plt
-            
             # Determine chart type from question
             q_lower = question.lower()
             
@@ -328,9 +442,12 @@ class AdvancedQuizSolver:
                     df.head(20).plot(kind='bar', ax=ax)
             
             plt.tight_layout()
-            
+
+            # tight_layout already handled spacing; skipping bbox_inches='tight'
+            # avoids a second layout pass, and 80 dpi keeps the PNG (and its
+            # base64 payload) small while staying readable
             buf = io.BytesIO()
-            plt.savefig(buf, format='png', dpi=100, bbox_inches='tight')
+            plt.savefig(buf, format='png', dpi=80)
             buf.seek(0)
             plt.close(fig)
             
@@ -341,6 +458,16 @@ class AdvancedQuizSolver:
     
     def _llm_solve(self, question: str, data_context: str, screenshot: bytes) -> Any:
         """Use LLM to solve the question"""
+        # Identical (question, context) pairs come back when the quiz chain
+        # re-serves a question after a wrong answer - skip the repeat LLM call
+        cache_key = (
+            hashlib.sha256(question.encode()).hexdigest(),
+            hashlib.sha256(data_context[:_MAX_CONTEXT_CHARS].encode()).hexdigest(),
+        )
+        if cache_key in self.answer_cache:
+            print("[AdvancedSolver] Answer cache hit")
+            return self.answer_cache[cache_key]
+
         prompt = f"""
 You are an expert data analyst. Solve this quiz question.
 
@@ -348,7 +475,7 @@ QUESTION:
 {question}
 
 DATA CONTEXT:
-{data_context[:50000]}  # Limit context size
+{data_context[:_MAX_CONTEXT_CHARS]}  # Limit context size
 
 INSTRUCTIONS:
 1. Analyze the data carefully
@@ -364,7 +491,9 @@ YOUR ANSWER (just the value):
 """
         
         response = self.llm.ask(prompt)
-        return self._parse_answer(response)
+        answer = self._parse_answer(response)
+        self.answer_cache[cache_key] = answer
+        return answer
     
     def _parse_answer(self, response: str) -> Any:
         """Parse and clean the answer"""
@@ -382,23 +511,30 @@ YOUR ANSWER (just the value):
                 response = '\n'.join(lines[1:])
             response = response.strip()
         
-        # Remove quotes
-        if (response.startswith('"') and response.endswith('"')) or \
-           (response.startswith("'") and response.endswith("'")):
+        # Remove matching surrounding quotes (single check on the end chars)
+        if len(response) >= 2 and response[0] == response[-1] and response[0] in '"\'':
             response = response[1:-1]
-        
-        # Try JSON first
+
+        # Try JSON first - anything json.loads produces is serializable by
+        # construction, so no round-trip through json.dumps is needed
         try:
-            result = json.loads(response)
-            # Validate it's serializable
-            json.dumps(result)
-            return result
-        except (json.JSONDecodeError, TypeError):
+            return _json_loads(response)
+        except ValueError:
             pass
         
-        # Try number
+        # Try number - fast path first: most numeric answers are already bare,
+        # so parse directly without building a cleaned-up copy of the string
+        try:
+            return int(response)
+        except ValueError:
+            try:
+                return float(response)
+            except ValueError:
+                pass
+
+        # Fall back to stripping stray characters (units, commas, etc.)
         try:
-            clean = re.sub(r'[^\d.\-e]', '', response)
+            clean = _NON_NUMERIC_RE.sub('', response)
             if clean:
                 if '.' in clean or 'e' in clean.lower():
                     return float(clean)
@@ -428,19 +564,19 @@ YOUR ANSWER (just the value):
         print(f"[AdvancedSolver] Answer type: {type(answer).__name__}")
         print(f"[AdvancedSolver] Answer preview: {str(answer)[:100]}")
         
-        async with httpx.AsyncClient(timeout=60) as client:
+        client = get_http_client()
+        try:
+            response = await client.post(submit_url, json=payload)
+
+            print(f"[AdvancedSolver] Response status: {response.status_code}")
+
             try:
-                response = await client.post(submit_url, json=payload)
-                
-                print(f"[AdvancedSolver] Response status: {response.status_code}")
-                
-                try:
-                    return response.json()
-                except:
-                    return {"error": response.text, "status_code": response.status_code}
-            except Exception as e:
-                print(f"[AdvancedSolver] Submission error: {e}")
-                return {"error": str(e), "submission_failed": True}
+                return response.json()
+            except:
+                return {"error": response.text, "status_code": response.status_code}
+        except Exception as e:
+            print(f"[AdvancedSolver] Submission error: {e}")
+            return {"error": str(e), "submission_failed": True}
     
     async def solve_and_submit(self, quiz_url: str) -> Dict:
         """Main method: solve and submit quiz chain"""
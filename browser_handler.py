@@ -2,17 +2,40 @@
 Browser automation using Playwright for JavaScript-rendered pages
 """
 import asyncio
+import time
 from playwright.async_api import async_playwright, Browser, Page, BrowserContext
 from typing import Optional, Tuple, List
 import base64
 import re
+from urllib.parse import urlparse
 from config import BROWSER_TIMEOUT
 
+# Hosts that only serve analytics/tracking - safe to drop for quiz pages
+_BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'facebook.net',
+    'hotjar.com',
+    'segment.io',
+    'mixpanel.com',
+)
+
+# Rendered pages are reused within a solve chain but must not be
+# served stale forever or pile up screenshot bytes in a long-lived server
+_PAGE_CACHE_TTL = 60  # seconds
+_PAGE_CACHE_MAX = 32  # entries
+
 class BrowserHandler:
     def __init__(self):
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self._page_cache = {}  # key -> (timestamp, result); TTL + FIFO bounded
+        # Concurrent tasks share one page; navigation and reads must not
+        # interleave or one task reads the other task's document
+        self._page_lock = asyncio.Lock()
     
     async def start(self):
         """Initialize the browser"""
@@ -24,14 +47,45 @@ class BrowserHandler:
                     '--no-sandbox',
                     '--disable-setuid-sandbox',
                     '--disable-dev-shm-usage',
-                    '--disable-gpu'
+                    '--disable-gpu',
+                    # Trim per-page overhead: no extensions, sync, background
+                    # chatter or audio, and fewer renderer processes
+                    '--no-first-run',
+                    '--no-default-browser-check',
+                    '--disable-extensions',
+                    '--disable-background-networking',
+                    '--disable-sync',
+                    '--mute-audio',
+                    '--disable-features=Translate,BackForwardCache,IsolateOrigins,site-per-process'
                 ]
             )
             self.context = await self.browser.new_context(
                 viewport={'width': 1920, 'height': 1080},
                 user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
             )
-    
+            # Skip fonts/media and analytics beacons - quiz pages don't need
+            # them and they dominate load time on slow networks
+            await self.context.route('**/*', self._filter_request)
+
+    @staticmethod
+    async def _filter_request(route, request):
+        if request.resource_type in ('font', 'media'):
+            await route.abort()
+            return
+        host = urlparse(request.url).hostname or ''
+        if any(host.endswith(blocked) for blocked in _BLOCKED_HOSTS):
+            await route.abort()
+            return
+        await route.continue_()
+
+    async def _get_page(self) -> Page:
+        """Get the shared page, navigating it in place instead of paying
+        new_page/close overhead on every operation"""
+        await self.start()
+        if self.page is None or self.page.is_closed():
+            self.page = await self.context.new_page()
+        return self.page
+
     async def stop(self):
         """Close the browser"""
         if self.context:
@@ -43,78 +97,121 @@ class BrowserHandler:
         self.playwright = None
         self.browser = None
         self.context = None
-    
+        self.page = None
+        self._page_cache = {}
+
     async def get_page_content(self, url: str) -> Tuple[str, str]:
         """
         Navigate to URL and get rendered HTML content
         Returns: (text_content, html_content)
         """
-        await self.start()
-        page = await self.context.new_page()
-        
-        try:
-            await page.goto(url, wait_until='networkidle', timeout=BROWSER_TIMEOUT)
-            await page.wait_for_timeout(2000)  # Wait for JS to execute
-            
+        cached = self._cache_get(('content', url))
+        if cached:
+            return cached
+
+        async with self._page_lock:
+            # Another task may have rendered this URL while we waited
+            cached = self._cache_get(('content', url))
+            if cached:
+                return cached
+
+            page = await self._get_page()
+
+            await self._goto_and_settle(page, url)
+
             # Get the rendered HTML
             html_content = await page.content()
-            
+
             # Get text content
             text_content = await page.evaluate('''() => {
                 return document.body.innerText || document.body.textContent;
             }''')
-            
-            return text_content.strip(), html_content
-        finally:
-            await page.close()
-    
+
+            result = (text_content.strip(), html_content)
+            self._cache_put(('content', url), result)
+            return result
+
     async def get_page_with_screenshot(self, url: str) -> Tuple[str, str, bytes]:
         """
         Get page content and screenshot
         Returns: (text_content, html_content, screenshot_bytes)
         """
-        await self.start()
-        page = await self.context.new_page()
-        
-        try:
-            await page.goto(url, wait_until='networkidle', timeout=BROWSER_TIMEOUT)
-            await page.wait_for_timeout(2000)
-            
+        cached = self._cache_get(('screenshot', url))
+        if cached:
+            return cached
+
+        async with self._page_lock:
+            cached = self._cache_get(('screenshot', url))
+            if cached:
+                return cached
+
+            page = await self._get_page()
+
+            await self._goto_and_settle(page, url)
+
             html_content = await page.content()
             text_content = await page.evaluate('''() => {
                 return document.body.innerText || document.body.textContent;
             }''')
             screenshot = await page.screenshot(full_page=True)
-            
-            return text_content.strip(), html_content, screenshot
-        finally:
-            await page.close()
+
+            result = (text_content.strip(), html_content, screenshot)
+            self._cache_put(('screenshot', url), result)
+            return result
     
+    async def _goto_and_settle(self, page: Page, url: str, settle_timeout: int = 5000):
+        """
+        Navigate and wait only as long as needed: return on DOMContentLoaded,
+        then give pending network activity a bounded chance to settle instead
+        of always sleeping a fixed 2s after 'networkidle'.
+        """
+        await page.goto(url, wait_until='domcontentloaded', timeout=BROWSER_TIMEOUT)
+        try:
+            await page.wait_for_load_state('networkidle', timeout=settle_timeout)
+        except Exception:
+            pass  # Page is usable even if some requests are still in flight
+
+    def _cache_get(self, key):
+        """Return a cached render if present and still fresh"""
+        entry = self._page_cache.get(key)
+        if not entry:
+            return None
+        timestamp, result = entry
+        if time.monotonic() - timestamp > _PAGE_CACHE_TTL:
+            del self._page_cache[key]
+            return None
+        return result
+
+    def _cache_put(self, key, result):
+        """Store a render, evicting the oldest entry at the size bound"""
+        if len(self._page_cache) >= _PAGE_CACHE_MAX:
+            self._page_cache.pop(next(iter(self._page_cache)))
+        self._page_cache[key] = (time.monotonic(), result)
+
+    def clear_page_cache(self):
+        """Drop cached page content (e.g. when fresh renders are required)"""
+        self._page_cache = {}
+
     async def download_file(self, url: str) -> Tuple[bytes, str]:
         """
         Download a file from URL
         Returns: (file_bytes, content_type)
         """
-        await self.start()
-        page = await self.context.new_page()
-        
-        try:
+        async with self._page_lock:
+            page = await self._get_page()
+
             response = await page.goto(url, timeout=BROWSER_TIMEOUT)
             content_type = response.headers.get('content-type', 'application/octet-stream')
             content = await response.body()
             return content, content_type
-        finally:
-            await page.close()
     
     async def extract_links(self, url: str) -> List[dict]:
         """Extract all links from a page"""
-        await self.start()
-        page = await self.context.new_page()
-        
-        try:
-            await page.goto(url, wait_until='networkidle', timeout=BROWSER_TIMEOUT)
-            await page.wait_for_timeout(1000)
-            
+        async with self._page_lock:
+            page = await self._get_page()
+
+            await self._goto_and_settle(page, url, settle_timeout=2000)
+
             links = await page.evaluate('''() => {
                 const anchors = document.querySelectorAll('a[href]');
                 return Array.from(anchors).map(a => ({
@@ -122,52 +219,41 @@ class BrowserHandler:
                     text: a.innerText.trim()
                 }));
             }''')
-            
+
             return links
-        finally:
-            await page.close()
     
     async def execute_script(self, url: str, script: str) -> any:
         """Execute JavaScript on a page and return result"""
-        await self.start()
-        page = await self.context.new_page()
-        
-        try:
-            await page.goto(url, wait_until='networkidle', timeout=BROWSER_TIMEOUT)
-            await page.wait_for_timeout(1000)
+        async with self._page_lock:
+            page = await self._get_page()
+
+            await self._goto_and_settle(page, url, settle_timeout=2000)
             result = await page.evaluate(script)
             return result
-        finally:
-            await page.close()
     
     async def fill_form_and_submit(self, url: str, form_data: dict, submit_selector: str = None) -> str:
         """Fill a form and submit it"""
-        await self.start()
-        page = await self.context.new_page()
-        
-        try:
-            await page.goto(url, wait_until='networkidle', timeout=BROWSER_TIMEOUT)
-            
+        async with self._page_lock:
+            page = await self._get_page()
+
+            await self._goto_and_settle(page, url)
+
             for selector, value in form_data.items():
                 await page.fill(selector, value)
-            
+
             if submit_selector:
                 await page.click(submit_selector)
                 await page.wait_for_load_state('networkidle')
-            
+
             return await page.content()
-        finally:
-            await page.close()
     
     async def get_table_data(self, url: str) -> List[List[str]]:
         """Extract table data from a page"""
-        await self.start()
-        page = await self.context.new_page()
-        
-        try:
-            await page.goto(url, wait_until='networkidle', timeout=BROWSER_TIMEOUT)
-            await page.wait_for_timeout(1000)
-            
+        async with self._page_lock:
+            page = await self._get_page()
+
+            await self._goto_and_settle(page, url, settle_timeout=2000)
+
             tables = await page.evaluate('''() => {
                 const tables = document.querySelectorAll('table');
                 return Array.from(tables).map(table => {
@@ -178,10 +264,8 @@ class BrowserHandler:
                     });
                 });
             }''')
-            
+
             return tables
-        finally:
-            await page.close()
 
 
 # Singleton instance
@@ -23,11 +23,6 @@ REQUEST_TIMEOUT = 180  # 3 minutes for quiz solving (CRITICAL)
 BROWSER_TIMEOUT = 60000  # 60 seconds for browser operations
 LLM_TIMEOUT = 120  # 2 minutes for LLM calls
 
-# Timeouts
-REQUEST_TIMEOUT = 180  # 3 minutes for quiz solving
-BROWSER_TIMEOUT = 60000  # 60 seconds for browser operations
-LLM_TIMEOUT = 120  # 2 minutes for LLM calls
-
 # LLM Settings
 GEMINI_MODEL = "gemini-2.0-flash"
 MAX_TOKENS = 8192
@@ -2,12 +2,52 @@
 Gemini LLM Client for quiz solving
 """
 import google.generativeai as genai
-import base64
 import json
 import re
 from typing import Optional, Union, Any
 from config import GEMINI_API_KEY, GEMINI_MODEL, MAX_TOKENS, TEMPERATURE
 
+# SIMD-accelerated base64 (AVX2/AVX-512) when available
+try:
+    import pybase64 as fastb64
+except ImportError:
+    import base64 as fastb64
+
+# Fast JSON codec when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Compiled once - _parse_answer runs per LLM response
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*')
+
+# Static instruction prefix shared by every solve_quiz call in a chain.
+# Keeping the identical prefix first lets the provider reuse its cached
+# prompt prefix across the up-to-20 quiz iterations.
+_SOLVE_PROMPT_PREFIX = """
+You are an expert data analyst and quiz solver. Solve the following quiz question.
+
+IMPORTANT INSTRUCTIONS:
+1. Analyze the question carefully
+2. If calculations are needed, show your work mentally but only return the final answer
+3. Return ONLY the final answer value - no explanations, no units, no additional text
+4. For numbers, return just the number (e.g., 42 or 3.14)
+5. For text, return just the text
+6. For boolean, return true or false
+7. For JSON, return valid JSON
+"""
+
+
+def _json_loads(text: str):
+    """Parse JSON with orjson when installed, stdlib otherwise"""
+    if HAS_ORJSON:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
 # Configure Gemini
 genai.configure(api_key=GEMINI_API_KEY)
 
@@ -48,7 +88,7 @@ class GeminiClient:
         try:
             image_part = {
                 "mime_type": mime_type,
-                "data": base64.b64encode(image_data).decode()
+                "data": fastb64.b64encode(image_data).decode()
             }
             response = self.vision_model.generate_content([prompt, image_part])
             return response.text
@@ -110,7 +150,7 @@ Return ONLY the answer value with no explanation or additional text.
         
         if answer_type == "number":
             # Extract number from response
-            numbers = re.findall(r'-?\d+\.?\d*', response)
+            numbers = _NUMBER_RE.findall(response)
             if numbers:
                 num = numbers[0]
                 return int(float(num)) if '.' not in num else float(num)
@@ -126,7 +166,7 @@ Return ONLY the answer value with no explanation or additional text.
         
         elif answer_type == "json":
             try:
-                return json.loads(response)
+                return _json_loads(response)
             except:
                 return response
         
@@ -134,33 +174,25 @@ Return ONLY the answer value with no explanation or additional text.
     
     def solve_quiz(self, question: str, data_context: str = "", images: list = None) -> Any:
         """Main method to solve a quiz question"""
-        prompt = f"""
-You are an expert data analyst and quiz solver. Solve the following quiz question.
-
+        prompt = f"""{_SOLVE_PROMPT_PREFIX}
 QUESTION:
 {question}
 
 {"DATA/CONTEXT:" + chr(10) + data_context if data_context else ""}
 
-IMPORTANT INSTRUCTIONS:
-1. Analyze the question carefully
-2. If calculations are needed, show your work mentally but only return the final answer
-3. Return ONLY the final answer value - no explanations, no units, no additional text
-4. For numbers, return just the number (e.g., 42 or 3.14)
-5. For text, return just the text
-6. For boolean, return true or false
-7. For JSON, return valid JSON
-
 YOUR ANSWER (just the value):
 """
         
         if images:
-            # Use vision model for image-based questions
+            # Use vision model for image-based questions; callers may pass
+            # bytes or an already-encoded base64 string - encode at most once
             parts = [prompt]
             for img_data, mime_type in images:
+                if isinstance(img_data, (bytes, bytearray)):
+                    img_data = fastb64.b64encode(img_data).decode()
                 parts.append({
                     "mime_type": mime_type,
-                    "data": base64.b64encode(img_data).decode() if isinstance(img_data, bytes) else img_data
+                    "data": img_data
                 })
             try:
                 response = self.vision_model.generate_content(parts)
@@ -190,7 +222,7 @@ YOUR ANSWER (just the value):
         
         # Try to parse as JSON
         try:
-            return json.loads(response)
+            return _json_loads(response)
         except:
             pass
         
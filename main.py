@@ -13,9 +13,25 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+# Serialize responses and parse request bodies with orjson when available
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as JSONResponse  # noqa: F811
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _json_loads(raw: bytes):
+    """Parse a request body with the fastest codec available"""
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 from config import SECRET, EMAIL, HOST, PORT, REQUEST_TIMEOUT
 from advanced_solver import AdvancedQuizSolver
 from browser_handler import close_browser
+from data_processor import close_http_client
 
 
 # Lifespan manager for startup/shutdown
@@ -29,6 +45,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("[SERVER] Shutting down...")
     await close_browser()
+    await close_http_client()
 
 
 # Create FastAPI app
@@ -85,8 +102,8 @@ async def process_quiz_request(request: Request):
     
     # Parse JSON body - return 400 for invalid JSON
     try:
-        body = await request.json()
-    except json.JSONDecodeError as e:
+        body = _json_loads(await request.body())
+    except ValueError as e:
         return JSONResponse(
             status_code=400,
             content={"status": "error", "message": f"Invalid JSON: {str(e)}"}
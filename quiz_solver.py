@@ -5,15 +5,128 @@ import asyncio
 import re
 import json
 import base64
-from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
-import httpx
+import pandas as pd
 
 from llm_client import llm, GeminiClient
 from browser_handler import get_browser, BrowserHandler
-from data_processor import processor, DataProcessor
+from data_processor import processor, DataProcessor, get_http_client
 from config import EMAIL, SECRET
 
+# Fast JSON codec when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# HTML parsing (C parser - much faster than regex href scanning)
+try:
+    from lxml import html as lxml_html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+
+def _json_dumps_indented(value: Any) -> str:
+    """Pretty-print JSON with the fastest codec available"""
+    if HAS_ORJSON:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(value, indent=2)
+
+
+# Precompiled page-parsing patterns - compiled once, not per quiz page.
+# The five submit-URL shapes are fused into one alternation so the page is
+# scanned once; alternative order keeps the old priority at a given position
+# (explicit instruction > bare /submit > bare /answer)
+_SUBMIT_RE = re.compile(
+    r'(?:post|submit|send)\s+(?:your\s+)?answer\s+to\s+(https?://[^\s<>"]+)'
+    r'|(?:POST|Submit)\s+to\s+(https?://[^\s<>"]+)'
+    # Bounded gap instead of '.*?' so a page without a submit URL can't
+    # trigger pathological backtracking over the whole document
+    r'|submit\s+[^<\n]{0,200}?(https?://[^\s<>"]+/submit[^\s<>"]*)'
+    r'|(https?://[^\s<>"]+/submit[^\s<>"]*)'
+    r'|(https?://[^\s<>"]+/answer[^\s<>"]*)',
+    re.IGNORECASE,
+)
+_HTML_SUBMIT_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'(?:post|submit|send)\s+(?:your\s+)?answer\s+to\s+["\']?(https?://[^\s<>"\']+)',
+        r'action=["\']?(https?://[^\s<>"\']+)["\']?',
+    )
+]
+# A bare file-URL match subsumes the old anchor/download variants - all three
+# captured the same URL shape, so one scan finds the identical set
+_FILE_URL_RE = re.compile(
+    r'(https?://[^\s<>"\']+\.(?:pdf|csv|xlsx?|json|txt|png|jpg|jpeg|gif))',
+    re.IGNORECASE,
+)
+_API_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        # '[:\s]+' alone replaces the old '\s*[:\s]+\s*' - the three adjacent
+        # overlapping quantifiers forced quadratic retries on whitespace runs
+        r'(?:api|endpoint|url)[:\s]+["\']?(https?://[^\s<>"\']+)["\']?',
+        r'(?:call|fetch|get)\s+(?:from\s+)?["\']?(https?://[^\s<>"\']+api[^\s<>"\']*)["\']?',
+    )
+]
+_HREF_PATTERN = re.compile(r'<a\s+[^>]*href=["\']?([^"\'\s>]+)["\']?[^>]*>', re.IGNORECASE)
+
+# Words that signal a conditional row count ('rows where/with/above ...')
+# rather than a plain 'how many rows' - those must not shortcut to len(df)
+_ROW_CONDITION_RE = re.compile(
+    r'\b(?:where|with|whose|that|which|greater|less|than|above|below|between'
+    r'|equal|contain|match|over|under|at least|at most)\b',
+    re.IGNORECASE,
+)
+
+# Numeric cleanup patterns for LLM responses, compiled once
+_NON_NUMERIC_RE = re.compile(r'[^\d.\-]')
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
+
+# Column-name extraction patterns, compiled once
+_SUM_COLUMN_RE = re.compile(r'(?:sum\s+of\s+(?:the\s+)?["\']?)(\w+)["\']?(?:\s+column)?', re.IGNORECASE)
+_QUOTED_COLUMN_RE = re.compile(r'["\'](\w+)["\']?\s+column', re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _find_question_column(question: str) -> Optional[str]:
+    """Extract the column name a question refers to.
+
+    Cached because the sum/count/average branches all probe the same
+    question within a single solve."""
+    column_match = _SUM_COLUMN_RE.search(question) or _QUOTED_COLUMN_RE.search(question)
+    return column_match.group(1) if column_match else None
+
+
+# urljoin reparses base_url on every call; the quiz loop joins dozens of
+# hrefs against the same base, so cache the parsed results
+_urljoin = lru_cache(maxsize=512)(urljoin)
+
+
+def _parse_numeric(text: str) -> Optional[Union[int, float]]:
+    """Strip stray characters from an LLM reply and parse the number"""
+    clean = _NON_NUMERIC_RE.sub('', text.strip())
+    if not clean:
+        return None
+    try:
+        return float(clean) if '.' in clean else int(clean)
+    except ValueError:
+        return None
+
+
+# Calculation keywords fused into one multi-pattern automaton; a single scan
+# collects every category that appears instead of one substring pass per word
+_CALC_KEYWORDS_RE = re.compile(
+    r'(?P<sum>sum)'
+    r'|(?P<count>count|how many)'
+    r'|(?P<average>average|mean)'
+    r'|(?P<chart>chart|plot|graph|visualiz|image)'
+)
+
 
 class QuizSolver:
     """Main quiz solver that orchestrates all components"""
@@ -23,7 +136,10 @@ class QuizSolver:
         self.secret = secret or SECRET
         self.llm = llm
         self.processor = processor
-    
+        self._parse_cache = {}  # (url, content hash) -> parsed page
+        self._llm_cache = {}  # (question hash, context hash) -> answer
+        self._dataframes = {}  # url -> parsed DataFrame for direct aggregation
+
     async def solve_quiz(self, quiz_url: str) -> Dict[str, Any]:
         """
         Main entry point - fetches quiz page and solves it
@@ -38,69 +154,32 @@ class QuizSolver:
         print(f"[QuizSolver] Page content length: {len(text_content)}")
         print(f"[QuizSolver] Content preview: {text_content[:500]}...")
         
-        # Parse the question and submission URL
-        question, submit_url, additional_urls = self._parse_quiz_page(text_content, html_content, quiz_url)
+        # Parse the question and submission URL - cached by page content so a
+        # re-served quiz iteration skips the regex passes entirely
+        parse_key = (quiz_url, hashlib.sha256(html_content.encode()).hexdigest())
+        if parse_key in self._parse_cache:
+            question, submit_url, additional_urls = self._parse_cache[parse_key]
+        else:
+            question, submit_url, additional_urls = self._parse_quiz_page(text_content, html_content, quiz_url)
+            self._parse_cache[parse_key] = (question, submit_url, additional_urls)
         
         print(f"[QuizSolver] Question: {question}")
         print(f"[QuizSolver] Submit URL: {submit_url}")
         print(f"[QuizSolver] Additional URLs: {additional_urls}")
         
-        # Gather additional data if needed
+        # Gather additional data concurrently - downloads overlap instead of
+        # paying each round trip in sequence
         data_context = ""
         images = []
-        
-        for url_info in additional_urls:
-            url = url_info['url']
-            print(f"[QuizSolver] Fetching additional data from: {url}")
-            
-            try:
-                content, content_type = await self.processor.fetch_url(url)
-                file_type = self.processor.detect_file_type(content, content_type, url)
-                
-                print(f"[QuizSolver] File type: {file_type}, Size: {len(content)} bytes")
-                
-                if file_type == 'pdf':
-                    pdf_data = self.processor.process_pdf(content)
-                    data_context += f"\n\n=== PDF Content ===\n{pdf_data['text']}"
-                    if pdf_data['tables']:
-                        data_context += f"\n\n=== PDF Tables ===\n"
-                        for table_info in pdf_data['tables']:
-                            data_context += f"\nPage {table_info['page']}:\n"
-                            for row in table_info['data']:
-                                data_context += str(row) + "\n"
-                
-                elif file_type == 'csv':
-                    df = self.processor.process_csv(content)
-                    data_context += f"\n\n=== CSV Data ===\n{self.processor.dataframe_to_context(df)}"
-                
-                elif file_type == 'excel':
-                    df = self.processor.process_excel(content)
-                    data_context += f"\n\n=== Excel Data ===\n{self.processor.dataframe_to_context(df)}"
-                
-                elif file_type == 'json':
-                    json_data = self.processor.process_json(content)
-                    data_context += f"\n\n=== JSON Data ===\n{json.dumps(json_data, indent=2)}"
-                
-                elif file_type == 'image':
-                    img_data = self.processor.process_image(content)
-                    images.append((content, f"image/{img_data['format']}"))
-                    data_context += f"\n\n=== Image ===\n[Image: {img_data['width']}x{img_data['height']} {img_data['format']}]"
-                
-                elif file_type == 'html':
-                    # Might be another web page to scrape
-                    html_text, html_full = await browser.get_page_content(url)
-                    data_context += f"\n\n=== Web Page Content ===\n{html_text}"
-                
-                else:
-                    # Plain text
-                    try:
-                        text = content.decode('utf-8')
-                    except:
-                        text = content.decode('latin-1')
-                    data_context += f"\n\n=== Text Content ===\n{text}"
-            
-            except Exception as e:
-                print(f"[QuizSolver] Error fetching {url}: {e}")
+        self._dataframes = {}  # fresh per quiz
+
+        if additional_urls:
+            fetched = await asyncio.gather(
+                *(self._fetch_additional_data(url_info['url'], browser)
+                  for url_info in additional_urls)
+            )
+            data_context = ''.join(ctx for ctx, _ in fetched)
+            images = [img for _, imgs in fetched for img in imgs]
         
         # Solve the question using LLM
         print(f"[QuizSolver] Solving with LLM...")
@@ -114,6 +193,70 @@ class QuizSolver:
             'question': question
         }
     
+    async def _fetch_additional_data(self, url: str, browser: BrowserHandler) -> Tuple[str, List]:
+        """Fetch and process one supporting URL; returns (context, images)"""
+        print(f"[QuizSolver] Fetching additional data from: {url}")
+        images = []
+
+        try:
+            content, content_type = await self.processor.fetch_url(url)
+            file_type = self.processor.detect_file_type(content, content_type, url)
+
+            print(f"[QuizSolver] File type: {file_type}, Size: {len(content)} bytes")
+
+            # Parsing PDFs/spreadsheets is CPU-bound - run it in a worker
+            # thread so concurrent fetches keep the event loop responsive
+            if file_type == 'pdf':
+                pdf_data = await asyncio.to_thread(self.processor.process_pdf, content)
+                # Build parts and join once - += recopies the growing context
+                # for every table row
+                parts = [f"\n\n=== PDF Content ===\n{pdf_data['text']}"]
+                if pdf_data['tables']:
+                    parts.append(f"\n\n=== PDF Tables ===\n")
+                    for table_info in pdf_data['tables']:
+                        parts.append(f"\nPage {table_info['page']}:\n")
+                        # map(str, ...) runs the row formatting in C instead
+                        # of a Python-level f-string per row
+                        parts.append('\n'.join(map(str, table_info['data'])))
+                        parts.append('\n')
+                return ''.join(parts), images
+
+            elif file_type == 'csv':
+                df = await asyncio.to_thread(self.processor.process_csv, content)
+                self._dataframes[url] = df
+                return f"\n\n=== CSV Data ===\n{self.processor.dataframe_to_context(df)}", images
+
+            elif file_type == 'excel':
+                df = await asyncio.to_thread(self.processor.process_excel, content)
+                self._dataframes[url] = df
+                return f"\n\n=== Excel Data ===\n{self.processor.dataframe_to_context(df)}", images
+
+            elif file_type == 'json':
+                json_data = self.processor.process_json(content)
+                return f"\n\n=== JSON Data ===\n{_json_dumps_indented(json_data)}", images
+
+            elif file_type == 'image':
+                img_data = self.processor.process_image(content)
+                # process_image already produced the base64 - reuse it
+                images.append((img_data['base64'], f"image/{img_data['format']}"))
+                return f"\n\n=== Image ===\n[Image: {img_data['width']}x{img_data['height']} {img_data['format']}]", images
+
+            elif file_type == 'html':
+                # Might be another web page to scrape
+                html_text, html_full = await browser.get_page_content(url)
+                return f"\n\n=== Web Page Content ===\n{html_text}", images
+
+            else:
+                # Plain text
+                text = content.decode('utf-8', errors='replace')
+                # Bound what reaches the LLM context - a huge text download
+                # should not be carried around in data_context wholesale
+                return f"\n\n=== Text Content ===\n{text[:50000]}", images
+
+        except Exception as e:
+            print(f"[QuizSolver] Error fetching {url}: {e}")
+            return '', images
+
     def _parse_quiz_page(self, text_content: str, html_content: str, base_url: str) -> Tuple[str, str, List[Dict]]:
         """
         Parse the quiz page to extract:
@@ -126,118 +269,140 @@ class QuizSolver:
         additional_urls = []
         
         # Find submission URL - look for patterns like "Post your answer to URL"
-        submit_patterns = [
-            r'(?:post|submit|send)\s+(?:your\s+)?answer\s+to\s+(https?://[^\s<>"]+)',
-            r'(?:POST|Submit)\s+to\s+(https?://[^\s<>"]+)',
-            r'submit\s+.*?(https?://[^\s<>"]+/submit[^\s<>"]*)',
-            r'(https?://[^\s<>"]+/submit[^\s<>"]*)',
-            r'(https?://[^\s<>"]+/answer[^\s<>"]*)',
-        ]
-        
-        for pattern in submit_patterns:
-            match = re.search(pattern, text_content, re.IGNORECASE)
-            if match:
-                submit_url = match.group(1).rstrip('.')
-                break
-        
+        match = _SUBMIT_RE.search(text_content)
+        if match:
+            submit_url = next(g for g in match.groups() if g).rstrip('.')
+
         # Also check HTML for submit URL
         if not submit_url:
-            html_submit_patterns = [
-                r'(?:post|submit|send)\s+(?:your\s+)?answer\s+to\s+["\']?(https?://[^\s<>"\']+)',
-                r'action=["\']?(https?://[^\s<>"\']+)["\']?',
-            ]
-            for pattern in html_submit_patterns:
-                match = re.search(pattern, html_content, re.IGNORECASE)
+            for pattern in _HTML_SUBMIT_PATTERNS:
+                match = pattern.search(html_content)
                 if match:
                     submit_url = match.group(1).rstrip('.')
                     break
-        
-        # Find file download URLs
-        file_patterns = [
-            r'<a\s+[^>]*href=["\']?(https?://[^\s<>"\']+\.(?:pdf|csv|xlsx?|json|txt|png|jpg|jpeg|gif))["\']?[^>]*>',
-            r'(?:download|file|data)\s+(?:from\s+)?["\']?(https?://[^\s<>"\']+\.(?:pdf|csv|xlsx?|json|txt|png|jpg|jpeg|gif))["\']?',
-            r'(https?://[^\s<>"\']+\.(?:pdf|csv|xlsx?|json|txt|png|jpg|jpeg|gif))',
-        ]
-        
+
+        # Find file download URLs - single pass over the HTML. Exclusion is
+        # a prefix test against the submit URL: the old substring check also
+        # matched everything when submit_url was empty, dropping every file
         found_urls = set()
-        for pattern in file_patterns:
-            matches = re.findall(pattern, html_content, re.IGNORECASE)
-            for match in matches:
-                url = match if isinstance(match, str) else match[0]
-                if url not in found_urls and submit_url not in url:
-                    found_urls.add(url)
-                    additional_urls.append({'url': url, 'type': 'file'})
-        
+        for url in _FILE_URL_RE.findall(html_content):
+            if url in found_urls or (submit_url and url.startswith(submit_url)):
+                continue
+            found_urls.add(url)
+            additional_urls.append({'url': url, 'type': 'file'})
+
         # Find API URLs
-        api_patterns = [
-            r'(?:api|endpoint|url)\s*[:\s]+\s*["\']?(https?://[^\s<>"\']+)["\']?',
-            r'(?:call|fetch|get)\s+(?:from\s+)?["\']?(https?://[^\s<>"\']+api[^\s<>"\']*)["\']?',
-        ]
-        
-        for pattern in api_patterns:
-            matches = re.findall(pattern, text_content, re.IGNORECASE)
+        for pattern in _API_PATTERNS:
+            matches = pattern.findall(text_content)
             for match in matches:
                 url = match if isinstance(match, str) else match[0]
-                if url not in found_urls and submit_url not in url:
-                    found_urls.add(url)
-                    additional_urls.append({'url': url, 'type': 'api'})
+                if url in found_urls or (submit_url and url.startswith(submit_url)):
+                    continue
+                found_urls.add(url)
+                additional_urls.append({'url': url, 'type': 'api'})
         
         # Also look for relative URLs in links
-        href_pattern = r'<a\s+[^>]*href=["\']?([^"\'\s>]+)["\']?[^>]*>'
-        for match in re.findall(href_pattern, html_content, re.IGNORECASE):
+        for match in self._extract_hrefs(html_content):
             if match.startswith('/') or not match.startswith(('http', '#', 'javascript')):
-                full_url = urljoin(base_url, match)
+                full_url = _urljoin(base_url, match)
                 if full_url not in found_urls and full_url != base_url:
                     found_urls.add(full_url)
                     additional_urls.append({'url': full_url, 'type': 'link'})
         
         return question, submit_url, additional_urls
-    
+
+    @staticmethod
+    def _extract_hrefs(html_content: str) -> List[str]:
+        """Pull href values out of the page with lxml when available"""
+        if HAS_LXML and html_content:
+            try:
+                tree = lxml_html.fromstring(html_content)
+                return tree.xpath('//a/@href | //link/@href')
+            except Exception:
+                pass
+        return _HREF_PATTERN.findall(html_content)
+
     async def _solve_question(self, question: str, data_context: str, images: List[Tuple[bytes, str]], html_content: str) -> Any:
         """Use LLM to solve the question"""
         
-        # Check for specific question types and handle accordingly
+        # Check for specific question types - one scan collects all categories,
+        # bailing out early once every category has been seen
         question_lower = question.lower()
-        
+        matched = set()
+        for m in _CALC_KEYWORDS_RE.finditer(question_lower):
+            matched.add(m.lastgroup)
+            if len(matched) == _CALC_KEYWORDS_RE.groups:
+                break
+
         # Sum calculation
-        if 'sum' in question_lower:
+        if 'sum' in matched:
             answer = await self._try_calculate_sum(question, data_context)
             if answer is not None:
                 return answer
-        
+
         # Count calculation
-        if 'count' in question_lower or 'how many' in question_lower:
+        if 'count' in matched:
             answer = await self._try_calculate_count(question, data_context)
             if answer is not None:
                 return answer
-        
+
         # Average calculation
-        if 'average' in question_lower or 'mean' in question_lower:
+        if 'average' in matched:
             answer = await self._try_calculate_average(question, data_context)
             if answer is not None:
                 return answer
-        
+
         # Chart/visualization generation
-        if any(word in question_lower for word in ['chart', 'plot', 'graph', 'visualiz', 'image']):
+        if 'chart' in matched:
             answer = await self._try_generate_chart(question, data_context)
             if answer is not None:
                 return answer
         
-        # General LLM solving
-        return self.llm.solve_quiz(question, data_context, images if images else None)
+        # General LLM solving - identical question+context pairs are answered
+        # from cache instead of repeating the call
+        llm_key = (
+            hashlib.sha256(question.encode()).hexdigest(),
+            hashlib.sha256(data_context.encode()).hexdigest(),
+        )
+        if llm_key in self._llm_cache:
+            print("[QuizSolver] LLM cache hit")
+            return self._llm_cache[llm_key]
+
+        answer = self.llm.solve_quiz(question, data_context, images if images else None)
+        self._llm_cache[llm_key] = answer
+        return answer
     
+    def _find_question_column(self, question: str) -> Optional[str]:
+        """Extract the column name a question refers to"""
+        return _find_question_column(question)
+
+    def _aggregate_column(self, column_name: str, agg: str) -> Optional[float]:
+        """Aggregate a named column across the quiz's parsed DataFrames"""
+        name_lower = column_name.lower()
+        for df in self._dataframes.values():
+            for col in df.columns:
+                if str(col).lower() == name_lower:
+                    values = pd.to_numeric(df[col], errors='coerce')
+                    # A text column coerces to all-NaN; sum()/count() would
+                    # confidently return 0 - let the LLM handle it instead
+                    if values.notna().any():
+                        return float(getattr(values, agg)())
+        return None
+
     async def _try_calculate_sum(self, question: str, data_context: str) -> Optional[Any]:
         """Try to calculate a sum from the data"""
-        # Extract column name from question
-        column_match = re.search(r'(?:sum\s+of\s+(?:the\s+)?["\']?)(\w+)["\']?(?:\s+column)?', question, re.IGNORECASE)
-        if not column_match:
-            column_match = re.search(r'["\'](\w+)["\']?\s+column', question, re.IGNORECASE)
-        
-        if column_match:
-            column_name = column_match.group(1)
-            
-            # Try to extract numerical values from context
-            prompt = f"""
+        column_name = self._find_question_column(question)
+        if not column_name:
+            return None
+
+        # Aggregate the parsed DataFrame directly - exact and free compared
+        # to asking the LLM to add the numbers
+        result = self._aggregate_column(column_name, 'sum')
+        if result is not None:
+            return int(result) if result.is_integer() else result
+
+        # No matching column parsed - fall back to the LLM
+        prompt = f"""
 From the following data, calculate the sum of the "{column_name}" column.
 
 DATA:
@@ -245,21 +410,26 @@ DATA:
 
 Return ONLY the numerical sum, nothing else. If you need to sum values, add them up precisely.
 """
-            result = self.llm.ask(prompt)
-            try:
-                # Clean the result
-                result = result.strip()
-                result = re.sub(r'[^\d.\-]', '', result)
-                if '.' in result:
-                    return float(result)
-                return int(result)
-            except:
-                pass
-        
-        return None
+        return _parse_numeric(self.llm.ask(prompt))
     
     async def _try_calculate_count(self, question: str, data_context: str) -> Optional[Any]:
         """Try to calculate a count from the data"""
+        # Unconditional row counts come straight from the DataFrame, but
+        # only when exactly one was parsed - with several files we can't
+        # tell which the question means. Conditional counts ('how many
+        # rows have X > 100') always need the LLM; a wrong confident
+        # len(df) is worse than the call
+        if (len(self._dataframes) == 1
+                and re.search(r'\brows?\b', question, re.IGNORECASE)
+                and not _ROW_CONDITION_RE.search(question)):
+            return int(len(next(iter(self._dataframes.values()))))
+
+        column_name = self._find_question_column(question)
+        if column_name:
+            result = self._aggregate_column(column_name, 'count')
+            if result is not None:
+                return int(result)
+
         prompt = f"""
 Based on the following data, answer the counting question.
 
@@ -271,16 +441,17 @@ QUESTION:
 
 Return ONLY the count as a number, nothing else.
 """
-        result = self.llm.ask(prompt)
-        try:
-            result = result.strip()
-            result = re.sub(r'[^\d]', '', result)
-            return int(result)
-        except:
-            return None
+        result = _NON_DIGIT_RE.sub('', self.llm.ask(prompt).strip())
+        return int(result) if result else None
     
     async def _try_calculate_average(self, question: str, data_context: str) -> Optional[Any]:
         """Try to calculate an average from the data"""
+        column_name = self._find_question_column(question)
+        if column_name:
+            result = self._aggregate_column(column_name, 'mean')
+            if result is not None:
+                return round(result, 2)
+
         prompt = f"""
 Based on the following data, calculate the average/mean requested.
 
@@ -292,13 +463,8 @@ QUESTION:
 
 Return ONLY the numerical average, nothing else. Round to 2 decimal places if needed.
 """
-        result = self.llm.ask(prompt)
-        try:
-            result = result.strip()
-            result = re.sub(r'[^\d.\-]', '', result)
-            return float(result)
-        except:
-            return None
+        result = _parse_numeric(self.llm.ask(prompt))
+        return float(result) if result is not None else None
     
     async def _try_generate_chart(self, question: str, data_context: str) -> Optional[str]:
         """Try to generate a chart and return as base64"""
@@ -316,18 +482,25 @@ Return ONLY the numerical average, nothing else. Round to 2 decimal places if ne
         }
         
         print(f"[QuizSolver] Submitting to {submit_url}")
-        print(f"[QuizSolver] Payload: {json.dumps(payload, indent=2)}")
+        # Log a bounded preview - serializing a base64 chart answer just for
+        # the log line can cost megabytes
+        answer_str = str(answer)
+        if len(answer_str) > 200:
+            answer_str = f"{answer_str[:200]}... ({len(answer_str)} chars)"
+        print(f"[QuizSolver] Answer: {answer_str}")
         
-        async with httpx.AsyncClient(timeout=60) as client:
-            response = await client.post(submit_url, json=payload)
-            
-            print(f"[QuizSolver] Response status: {response.status_code}")
-            print(f"[QuizSolver] Response: {response.text}")
-            
-            try:
-                return response.json()
-            except:
-                return {"error": response.text, "status_code": response.status_code}
+        # Shared pooled client (see data_processor.get_http_client) - avoids a
+        # fresh TLS handshake per submission
+        client = get_http_client()
+        response = await client.post(submit_url, json=payload)
+
+        print(f"[QuizSolver] Response status: {response.status_code}")
+        print(f"[QuizSolver] Response: {response.text}")
+
+        try:
+            return response.json()
+        except:
+            return {"error": response.text, "status_code": response.status_code}
     
     async def solve_and_submit(self, quiz_url: str) -> Dict[str, Any]:
         """Solve a quiz and submit the answer, handling chains"""
@@ -0,0 +1,59 @@
+"""
+Disk-persisted cache for the fixed LLM test prompts
+Re-runs of the local tests answer from .cache/llm_cache.json instead of
+hitting Gemini again - instant, deterministic, and free
+"""
+import hashlib
+import json
+from pathlib import Path
+
+from config import GEMINI_MODEL
+from llm_client import llm
+
+_CACHE_PATH = Path(".cache/llm_cache.json")
+_cache = None
+
+
+def _load():
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(_CACHE_PATH.read_text(encoding='utf-8'))
+        except Exception:
+            _cache = {}
+    return _cache
+
+
+def _save():
+    _CACHE_PATH.parent.mkdir(exist_ok=True)
+    _CACHE_PATH.write_text(json.dumps(_cache, indent=2, default=str), encoding='utf-8')
+
+
+def _key(prompt: str, context: str = "") -> str:
+    return hashlib.sha256(f"{GEMINI_MODEL}\0{prompt}\0{context or ''}".encode()).hexdigest()
+
+
+def cached_llm_ask(prompt: str, context: str = "") -> str:
+    """llm.ask keyed by sha256(model + prompt + context)"""
+    cache = _load()
+    key = _key(prompt, context)
+    if key in cache:
+        return cache[key]
+    response = llm.ask(prompt, context)
+    if response:
+        cache[key] = response
+        _save()
+    return response
+
+
+def cached_llm_solve(question: str, data_context: str = ""):
+    """llm.solve_quiz with the same disk cache"""
+    cache = _load()
+    key = _key(question, data_context)
+    if key in cache:
+        return cache[key]
+    answer = llm.solve_quiz(question, data_context)
+    if answer is not None:
+        cache[key] = answer
+        _save()
+    return answer
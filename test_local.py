@@ -4,12 +4,20 @@ Run this to test your implementation locally
 """
 import asyncio
 import json
-import httpx
+
+# libuv-backed event loop - lower scheduling overhead for the httpx and
+# Playwright awaits when installed (not available on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 from config import EMAIL, SECRET
-from quiz_solver import QuizSolver, solve_quiz
+from quiz_solver import QuizSolver
 from browser_handler import get_browser, close_browser
-from llm_client import llm
+from data_processor import get_http_client, close_http_client
+from test_cache import cached_llm_ask, cached_llm_solve
 
 
 async def test_browser():
@@ -17,14 +25,16 @@ async def test_browser():
     print("\n=== Testing Browser ===")
     browser = await get_browser()
     
-    # Test with a simple page
-    test_url = "https://httpbin.org/html"
+    # A data: URL keeps the startup check local - no DNS/TLS round trip
+    # or flaky external service on every test run
+    test_url = "data:text/html,<html><body><h1>Browser check</h1><p>Static fixture page.</p></body></html>"
     text, html = await browser.get_page_content(test_url)
     print(f"Text length: {len(text)}")
     print(f"HTML length: {len(html)}")
     print(f"Sample text: {text[:200]}...")
-    
-    await close_browser()
+
+    # Leave the browser running - Chromium startup costs seconds, so any
+    # test that follows reuses it; main() closes it once at the end
     print("✅ Browser test passed!")
 
 
@@ -32,8 +42,9 @@ async def test_llm():
     """Test LLM functionality"""
     print("\n=== Testing LLM ===")
     
-    # Simple question
-    response = llm.ask("What is 2 + 2? Reply with just the number.")
+    # Simple question - the Gemini SDK is synchronous, so run it in a
+    # worker thread to keep the browser test progressing alongside
+    response = await asyncio.to_thread(cached_llm_ask, "What is 2 + 2? Reply with just the number.")
     print(f"2 + 2 = {response}")
     
     # Data extraction
@@ -44,7 +55,7 @@ async def test_llm():
     | B    | 20    |
     | C    | 30    |
     """
-    response = llm.solve_quiz("What is the sum of all values?", context)
+    response = await asyncio.to_thread(cached_llm_solve, "What is the sum of all values?", context)
     print(f"Sum of values: {response}")
     
     print("✅ LLM test passed!")
@@ -72,42 +83,45 @@ async def test_server_locally():
     """Test the local server"""
     print("\n=== Testing Local Server ===")
     
-    async with httpx.AsyncClient() as client:
-        # Health check
-        try:
-            response = await client.get("http://localhost:8000/health")
-            print(f"Health check: {response.json()}")
-        except:
-            print("❌ Server not running. Start with: python main.py")
-            return
-        
-        # Test invalid JSON
-        response = await client.post(
-            "http://localhost:8000/",
-            content="not json",
-            headers={"Content-Type": "application/json"}
-        )
-        print(f"Invalid JSON response: {response.status_code} - {response.json()}")
-        
-        # Test invalid secret
-        response = await client.post(
-            "http://localhost:8000/",
-            json={"email": "test@test.com", "secret": "wrong"}
-        )
-        print(f"Invalid secret response: {response.status_code} - {response.json()}")
-        
-        # Test valid request
-        response = await client.post(
-            "http://localhost:8000/",
-            json={
-                "email": EMAIL,
-                "secret": SECRET,
-                "url": "https://tds-llm-analysis.s-anand.net/demo"
-            }
-        )
-        print(f"Valid request response: {response.status_code}")
-        print(f"Response: {json.dumps(response.json(), indent=2, default=str)}")
-    
+    # Shared pooled client - keep-alive reuse instead of a fresh
+    # TCP handshake per request
+    client = get_http_client()
+
+    # Health check
+    try:
+        response = await client.get("http://localhost:8000/health")
+        print(f"Health check: {response.json()}")
+    except:
+        print("❌ Server not running. Start with: python main.py")
+        return
+
+    # Test invalid JSON
+    response = await client.post(
+        "http://localhost:8000/",
+        content="not json",
+        headers={"Content-Type": "application/json"}
+    )
+    print(f"Invalid JSON response: {response.status_code} - {response.json()}")
+
+    # Test invalid secret
+    response = await client.post(
+        "http://localhost:8000/",
+        json={"email": "test@test.com", "secret": "wrong"}
+    )
+    print(f"Invalid secret response: {response.status_code} - {response.json()}")
+
+    # Test valid request
+    response = await client.post(
+        "http://localhost:8000/",
+        json={
+            "email": EMAIL,
+            "secret": SECRET,
+            "url": "https://tds-llm-analysis.s-anand.net/demo"
+        }
+    )
+    print(f"Valid request response: {response.status_code}")
+    print(f"Response: {json.dumps(response.json(), indent=2, default=str)}")
+
     print("✅ Local server test completed!")
 
 
@@ -116,16 +130,18 @@ async def main():
     print("🧪 LLM Analysis Quiz - Local Tests")
     print("="*50)
     
-    # Test components
-    await test_browser()
-    await test_llm()
+    # Test components concurrently - browser startup and the LLM round
+    # trips have no ordering dependency, so overlap them on the event loop
+    await asyncio.gather(test_browser(), test_llm())
     
     # Optionally test demo endpoint
     # await test_demo_endpoint()
     
     # Test local server (uncomment when server is running)
     # await test_server_locally()
-    
+
+    await close_browser()
+    await close_http_client()
     print("\n✅ All tests completed!")
 
 
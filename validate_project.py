@@ -2,58 +2,120 @@
 """
 Project validation script - Checks all requirements are met
 """
+import ast
+import mmap
 import os
-import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 
+# Report lines buffered here - one stdout write at the end of main()
+# instead of a flushed syscall per check
+_out = []
+
+def emit(message):
+    """Queue a report line for the single flush at the end of main()"""
+    _out.append(message)
+
+def flush_output():
+    """Write everything buffered so far in one syscall"""
+    sys.stdout.write('\n'.join(_out) + '\n')
+    _out.clear()
+
+@lru_cache(maxsize=None)
+def read_file(filepath):
+    """Read a file's raw bytes once; every pattern checked against it
+    reuses the cache. Searching bytes skips the UTF-8 decode pass, which
+    for ASCII-heavy source files is pure overhead"""
+    return Path(filepath).read_bytes()
+
+# Below this size the mmap setup overhead outweighs the zero-copy win
+_MMAP_MIN_BYTES = 4096
+
+@lru_cache(maxsize=None)
+def _mmap_file(filepath):
+    """Zero-copy page-cache view of a file, mapped once per run"""
+    with open(filepath, 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def file_contains_bytes(filepath, needle):
+    """Substring test - larger files are scanned through an mmap view
+    (libc memmem over raw pages, no intermediate copy)"""
+    try:
+        if os.path.getsize(filepath) >= _MMAP_MIN_BYTES:
+            return _mmap_file(filepath).find(needle) != -1
+    except (OSError, ValueError):
+        pass
+    return needle in read_file(filepath)
+
+@lru_cache(maxsize=None)
+def _dir_entries(dirname):
+    """Names in a directory from one getdents sweep - every existence check
+    against that directory is then a set lookup instead of a stat syscall"""
+    try:
+        return frozenset(entry.name for entry in os.scandir(dirname or '.'))
+    except OSError:
+        return frozenset()
+
 def check_file_exists(filepath, description):
-    """Check if a file exists"""
-    if os.path.exists(filepath):
-        print(f"✓ {description}")
-        return True
-    else:
-        print(f"✗ {description} - MISSING")
-        return False
+    """Check if a file exists; returns (ok, message)"""
+    dirname, name = os.path.split(filepath)
+    if name in _dir_entries(dirname):
+        return True, f"✓ {description}"
+    return False, f"✗ {description} - MISSING"
 
 def check_file_contains(filepath, text, description):
-    """Check if a file contains specific text"""
+    """Check if a file contains specific text; returns (ok, message)"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            if text in content:
-                print(f"✓ {description}")
-                return True
-            else:
-                print(f"✗ {description} - NOT FOUND")
-                return False
+        if file_contains_bytes(filepath, text.encode('utf-8')):
+            return True, f"✓ {description}"
+        return False, f"✗ {description} - NOT FOUND"
     except Exception as e:
-        print(f"✗ {description} - ERROR: {e}")
-        return False
+        return False, f"✗ {description} - ERROR: {e}"
+
+def run_checks(checks):
+    """Run check callables in parallel; results come back in submission order
+    so the report reads the same as the sequential version"""
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        return list(pool.map(lambda check: check(), checks))
+
+def report(result):
+    """Print a check's message and return whether it passed"""
+    ok, message = result
+    emit(message)
+    return ok
 
 def validate_python_syntax(filepath):
     """Check Python syntax"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            compile(f.read(), filepath, 'exec')
+        # ast.parse stops after parsing - compile() would also emit
+        # bytecode that we immediately discard. Feeding it the cached raw
+        # bytes lets the tokenizer handle decoding itself (honoring any
+        # encoding cookie) instead of paying a separate str decode first
+        ast.parse(read_file(filepath), filename=filepath)
         return True
-    except SyntaxError as e:
-        print(f"  Syntax error: {e}")
+    except (SyntaxError, ValueError) as e:
+        emit(f"  Syntax error: {e}")
         return False
     except Exception as e:
-        print(f"  Error: {e}")
+        emit(f"  Error: {e}")
         return False
 
 def main():
-    print("\n" + "="*60)
-    print("LLM Analysis Quiz - Project Validation")
-    print("="*60 + "\n")
+    # --fast: stop at the first failing group instead of grinding through
+    # docs checks on a project already known broken - quicker CI feedback
+    fast_fail = '--fast' in sys.argv[1:]
+
+    emit("\n" + "="*60)
+    emit("LLM Analysis Quiz - Project Validation")
+    emit("="*60 + "\n")
     
     checks_passed = 0
     checks_failed = 0
     
     # Core application files
-    print("Core Application Files:")
+    emit("Core Application Files:")
     core_files = [
         ("main.py", "Main FastAPI server"),
         ("config.py", "Configuration management"),
@@ -64,20 +126,26 @@ def main():
         ("data_processor.py", "Data processing utilities"),
     ]
     
-    for filepath, description in core_files:
-        if check_file_exists(filepath, description):
+    results = run_checks([partial(check_file_exists, f, d) for f, d in core_files])
+    for (filepath, description), result in zip(core_files, results):
+        if report(result):
             checks_passed += 1
             if filepath.endswith('.py'):
                 if validate_python_syntax(filepath):
-                    print(f"  └─ Syntax: OK")
+                    emit(f"  └─ Syntax: OK")
                 else:
-                    print(f"  └─ Syntax: INVALID")
+                    emit(f"  └─ Syntax: INVALID")
                     checks_failed += 1
         else:
             checks_failed += 1
-    
+
+    if fast_fail and checks_failed:
+        emit(f"\n⚠️  {checks_failed} core check(s) failed - skipping the rest (--fast)")
+        flush_output()
+        return 1
+
     # Configuration files
-    print("\nConfiguration Files:")
+    emit("\nConfiguration Files:")
     config_files = [
         ("requirements.txt", "Python dependencies"),
         ("Dockerfile", "Docker configuration"),
@@ -86,14 +154,15 @@ def main():
         ("LICENSE", "MIT License"),
     ]
     
-    for filepath, description in config_files:
-        if check_file_exists(filepath, description):
+    results = run_checks([partial(check_file_exists, f, d) for f, d in config_files])
+    for result in results:
+        if report(result):
             checks_passed += 1
         else:
             checks_failed += 1
     
     # Documentation files
-    print("\nDocumentation Files:")
+    emit("\nDocumentation Files:")
     docs_files = [
         ("README.md", "Main documentation"),
         ("SETUP_GUIDE.md", "Setup and submission guide"),
@@ -102,29 +171,31 @@ def main():
         ("IMPLEMENTATION_SUMMARY.md", "Implementation summary"),
     ]
     
-    for filepath, description in docs_files:
-        if check_file_exists(filepath, description):
+    results = run_checks([partial(check_file_exists, f, d) for f, d in docs_files])
+    for result in results:
+        if report(result):
             checks_passed += 1
         else:
             checks_failed += 1
     
     # Testing files
-    print("\nTesting Files:")
+    emit("\nTesting Files:")
     test_files = [
         ("test_endpoint.py", "Endpoint test script"),
     ]
     
-    for filepath, description in test_files:
-        if check_file_exists(filepath, description):
+    results = run_checks([partial(check_file_exists, f, d) for f, d in test_files])
+    for result in results:
+        if report(result):
             checks_passed += 1
         else:
             checks_failed += 1
     
     # Content verification
-    print("\nContent Verification:")
+    emit("\nContent Verification:")
     
     # Check for hardcoded credentials
-    print("  Checking for hardcoded credentials in main files...")
+    emit("  Checking for hardcoded credentials in main files...")
     checks = [
         ("main.py", "SECRET =", "Hardcoded SECRET in main.py", True),  # Should NOT contain
         ("config.py", 'os.getenv("SECRET"', "Correct SECRET loading in config", False),  # Should contain
@@ -136,76 +207,64 @@ def main():
         if should_not_contain:
             # These files should NOT contain this text
             try:
-                with open(filepath, 'r') as f:
-                    content = f.read()
-                    if text not in content:
-                        print(f"✓ {description}")
-                        checks_passed += 1
-                    else:
-                        print(f"✗ {description} - FOUND (should not be there)")
-                        checks_failed += 1
+                if not file_contains_bytes(filepath, text.encode('utf-8')):
+                    emit(f"✓ {description}")
+                    checks_passed += 1
+                else:
+                    emit(f"✗ {description} - FOUND (should not be there)")
+                    checks_failed += 1
             except:
                 pass
         else:
             # These files SHOULD contain this text
-            if check_file_contains(filepath, text, description):
+            if report(check_file_contains(filepath, text, description)):
                 checks_passed += 1
             else:
                 checks_failed += 1
     
     # Check API status codes
-    print("\nAPI Specification Checks:")
-    if check_file_contains("main.py", "status_code=400", "HTTP 400 for invalid JSON"):
-        checks_passed += 1
-    else:
-        checks_failed += 1
-    
-    if check_file_contains("main.py", "status_code=403", "HTTP 403 for invalid secret"):
-        checks_passed += 1
-    else:
-        checks_failed += 1
-    
-    if check_file_contains("main.py", "status_code=200", "HTTP 200 for valid requests"):
-        checks_passed += 1
-    else:
-        checks_failed += 1
-    
-    if check_file_contains("config.py", "REQUEST_TIMEOUT = 180", "3-minute timeout configured"):
-        checks_passed += 1
-    else:
-        checks_failed += 1
-    
-    if check_file_contains("main.py", "asyncio.wait_for", "Timeout management in place"):
-        checks_passed += 1
-    else:
-        checks_failed += 1
-    
+    emit("\nAPI Specification Checks:")
+    api_checks = [
+        ("main.py", "status_code=400", "HTTP 400 for invalid JSON"),
+        ("main.py", "status_code=403", "HTTP 403 for invalid secret"),
+        ("main.py", "status_code=200", "HTTP 200 for valid requests"),
+        ("config.py", "REQUEST_TIMEOUT = 180", "3-minute timeout configured"),
+        ("main.py", "asyncio.wait_for", "Timeout management in place"),
+    ]
+    results = run_checks([partial(check_file_contains, f, t, d) for f, t, d in api_checks])
+    for result in results:
+        if report(result):
+            checks_passed += 1
+        else:
+            checks_failed += 1
+
     # Check for .env in gitignore
-    print("\nSecurity Checks:")
-    if check_file_contains(".gitignore", ".env", ".env excluded from git"):
+    emit("\nSecurity Checks:")
+    if report(check_file_contains(".gitignore", ".env", ".env excluded from git")):
         checks_passed += 1
     else:
         checks_failed += 1
-    
+
     # Check for license
-    if check_file_contains("LICENSE", "MIT License", "MIT License present"):
+    if report(check_file_contains("LICENSE", "MIT License", "MIT License present")):
         checks_passed += 1
     else:
         checks_failed += 1
     
     # Summary
-    print("\n" + "="*60)
-    print("VALIDATION SUMMARY")
-    print("="*60)
-    print(f"✓ Passed: {checks_passed}")
-    print(f"✗ Failed: {checks_failed}")
+    emit("\n" + "="*60)
+    emit("VALIDATION SUMMARY")
+    emit("="*60)
+    emit(f"✓ Passed: {checks_passed}")
+    emit(f"✗ Failed: {checks_failed}")
     
     if checks_failed == 0:
-        print("\n🎉 All checks passed! Project is ready for submission.")
-        return 0
+        emit("\n🎉 All checks passed! Project is ready for submission.")
     else:
-        print(f"\n⚠️  {checks_failed} check(s) failed. Please fix the issues above.")
-        return 1
+        emit(f"\n⚠️  {checks_failed} check(s) failed. Please fix the issues above.")
+
+    flush_output()
+    return 0 if checks_failed == 0 else 1
 
 if __name__ == "__main__":
     sys.exit(main())